@@ -1,9 +1,8 @@
 import asyncio
 import contextlib
-from collections import defaultdict
 from datetime import datetime, timedelta
 from inspect import iscoroutinefunction
-from typing import Callable, Optional
+from typing import AsyncIterator, Callable, Optional, get_args
 
 import msgspec
 import orjson
@@ -24,15 +23,27 @@ from kiwoom.config.http import (
     WEBSOCKET_QUEUE_MAX_SIZE,
     State,
 )
-from kiwoom.config.real import RealData, RealType
+from kiwoom.config.real import (
+    LoginType,
+    RealData,
+    RealType,
+    RealTypeAny,
+    RealTypeCode,
+    RegisterType,
+)
 from kiwoom.config.trade import (
+    REQUEST_DATA,
     REQUEST_LIMIT_DAYS,
 )
 from kiwoom.http.client import Client
 from kiwoom.http.socket import Socket
 from kiwoom.http.utils import (
+    ALWAYS_TRUE,
+    FastQueue,
+    callback_worker,
     cancel,
     wrap_async_callback,
+    wrap_batch_callback,
     wrap_sync_callback,
 )
 
@@ -45,14 +56,14 @@ class API(Client):
     직접 API 스펙을 구현하여 활용합니다.
     """
 
-    def __init__(self, host: str, appkey: str, secretkey: str):
+    def __init__(self, host: str, appkey: str | bytes, secretkey: str | bytes):
         """
         API 클래스 인스턴스를 초기화합니다.
 
         Args:
             host (str): 실서버 / 모의서버 도메인
-            appkey (str): 파일경로 / 앱키
-            secretkey (str): 파일경로 / 시크릿키
+            appkey (str | bytes): 파일경로 / 앱키
+            secretkey (str | bytes): 파일경로 / 시크릿키
 
         Raises:
             ValueError: 유효하지 않은 도메인
@@ -68,19 +79,23 @@ class API(Client):
                 raise ValueError(f"Invalid host: {self.host}")
 
         super().__init__(host, appkey, secretkey)
-        self.queue = asyncio.Queue(maxsize=WEBSOCKET_QUEUE_MAX_SIZE)
+        self.queue = FastQueue(maxsize=WEBSOCKET_QUEUE_MAX_SIZE)
         self.socket = Socket(url=wss_url, queue=self.queue)
         self._limiter.set(rps)
+        self._rps = rps
 
         self._state = State.CLOSED
         self._state_lock = asyncio.Lock()
         self._recv_task: asyncio.Task | None = None
+        self._close_task: asyncio.Task | None = None
+        self._ping_tasks: set[asyncio.Task] = set()
         self._stop_event = asyncio.Event()
         self._stop_event.set()
 
-        self._sem = asyncio.Semaphore(config.http.WEBSOCKET_MAX_CONCURRENCY)
-        async_print = wrap_sync_callback(self._sem, lambda msg: print(msg))
-        self._callbacks = defaultdict(lambda: async_print)
+        self._workers: list[asyncio.Task] = []
+        self._callback_queue = asyncio.Queue()
+        self._default_callback: Callable = print
+        self._callbacks: dict[str, Callable] = dict()
         self._add_default_callback_on_real_data()
 
     async def connect(self, headers: Optional[dict] = None):
@@ -103,6 +118,7 @@ class API(Client):
                 # Cancel existing task
                 self._stop_event.set()
                 await cancel(self._recv_task)
+                await self._cancel_workers()
 
                 # Connect http server
                 await super().connect(self._appkey, self._secretkey, headers)
@@ -112,8 +128,12 @@ class API(Client):
                 # Connect websocket server
                 await self.socket.connect(self._session, token)
 
-                # Run websocket receiving task
+                # Run websocket receiving task and callback workers
                 self._stop_event.clear()
+                self._workers = [
+                    asyncio.create_task(callback_worker(self._callback_queue), name="callback")
+                    for _ in range(config.http.WEBSOCKET_CALLBACK_WORKERS)
+                ]
                 self._recv_task = asyncio.create_task(self._on_receive_websocket(), name="dequeue")
                 self._state = State.CONNECTED
 
@@ -140,6 +160,8 @@ class API(Client):
                 with contextlib.suppress(EXCEPTIONS_TO_SUPPRESS):
                     await asyncio.shield(cancel(self._recv_task))
                 self._recv_task = None
+                with contextlib.suppress(EXCEPTIONS_TO_SUPPRESS):
+                    await asyncio.shield(self._cancel_workers())
 
                 # Close websocket server
                 with contextlib.suppress(EXCEPTIONS_TO_SUPPRESS):
@@ -227,12 +249,12 @@ class API(Client):
         ctype = ctype.lower()
         endpoint = "/api/dostk/chart"
         api_id = PERIOD_TO_API_ID[ctype][period]
-        data = dict(PERIOD_TO_DATA[ctype][period])
+        base = PERIOD_TO_DATA[ctype][period]
         match ctype:
             case "stock":
-                data["stk_cd"] = code
+                data = {**base, "stk_cd": code}
             case "sector":
-                data["inds_cd"] = code
+                data = {**base, "inds_cd": code}
             case _:
                 raise ValueError(f"'ctype' must be one of [stock, sector], not {ctype=}.")
         if period == "day":
@@ -243,22 +265,16 @@ class API(Client):
         key: str = PERIOD_TO_BODY_KEY[ctype][period]
         time: str = PERIOD_TO_TIME_KEY[period]
 
-        def should_continue(body: dict) -> bool:
-            # Validate
-            if not valid(body, period, ctype):
-                return False
-            # Request full data
-            if not start:
-                return True
+        def is_after_start(body: dict) -> bool:
             # Condition to continue
-            chart = body[key]
-            earliest = chart[-1][time][:ymd]
-            return start <= earliest
+            return valid(body, period, ctype) and start <= body[key][-1][time][:ymd]
 
+        # Request full data if start is not given
+        should_continue = is_after_start if start else (lambda body: valid(body, period, ctype))
         body = await self.request_until(should_continue, endpoint, api_id, data=data)
         return body
 
-    async def trade(self, start: str, end: str = "") -> list[dict]:
+    async def trade(self, start: str, end: str = "") -> list[tuple[str, list[dict]]]:
         """
         주어진 시작일자와 종료일자에 해당하는 체결내역을
         키움증권 '0343' 계좌 체결내역 화면과 동일한 구성으로 반환합니다.
@@ -272,51 +288,72 @@ class API(Client):
             end (str, optional): 종료일자 in YYYYMMDD format
 
         Returns:
-            list[dict]: 체결내역 데이터를 포함하는 json 응답 리스트
+            list[tuple[str, list[dict]]]: (주문일자 YYYY-MM-DD, 체결내역 json 리스트) 일자별 리스트
+        """
+        return [day async for day in self.trade_iter(start, end)]
+
+    async def trade_iter(self, start: str, end: str = "") -> AsyncIterator[tuple[str, list[dict]]]:
+        """
+        trade()와 동일한 체결내역을 일자 순서대로 조회되는 즉시 하나씩 반환합니다.
+        모든 일자를 동시에 요청하므로, 반환된 데이터를 처리하는 동안에도 조회가 계속됩니다.
+
+        Args:
+            start (str): 시작일자 in YYYYMMDD format
+            end (str, optional): 종료일자 in YYYYMMDD format
+
+        Yields:
+            tuple[str, list[dict]]: (주문일자 YYYY-MM-DD, 체결내역 json 리스트)
         """
         endpoint = "/api/dostk/acnt"
         api_id = "kt00009"
-        data = {
-            "ord_dt": "",  # YYYYMMDD (Optional)
-            "qry_tp": "1",  # 전체/체결
-            "stk_bond_tp": "1",  # 전체/주식/채권
-            "mrkt_tp": "0",  # 전체/코스피/코스닥/OTCBB/ECN
-            "sell_tp": "0",  # 전체/매도/매수
-            "dmst_stex_tp": "%",  # 전체/KRX/NXT/SOR
-            # 'stk_cd': '',  # 종목코드 (Optional)
-            # 'fr_ord_no': '',  # 시작주문번호 (Optional)
-        }
 
         today = datetime.today()
         start = datetime.strptime(start, "%Y%m%d")
         start = max(start, today - timedelta(days=REQUEST_LIMIT_DAYS))
-        end = datetime.strptime(end, "%Y%m%d") if end else datetime.today()
-        end = min(end, datetime.today())
+        end = datetime.strptime(end, "%Y%m%d") if end else today
+        end = min(end, today)
 
-        trs = []
         key = "acnt_ord_cntr_prst_array"
-        for bday in bdate_range(start, end):
-            dic = dict(data)
-            dic["ord_dt"] = bday.strftime("%Y%m%d")  # manually set ord_dt
-            body = await self.request_until(lambda x: True, endpoint, api_id, data=dic)
-            if key in body:
-                # Append order date to each record
-                for rec in body[key]:
-                    rec["ord_dt"] = bday.strftime("%Y-%m-%d")
-                trs.extend(body[key])
-        return trs
-
-    def add_callback_on_real_data(self, real_type: str, callback: Callable) -> None:
+        sem = asyncio.Semaphore(self._rps)  # same as rate limit of the host
+
+        async def fetch(ymd: str, iso: str) -> tuple[str, list[dict]]:
+            dic = {**REQUEST_DATA, "ord_dt": ymd}  # manually set ord_dt
+            # Requests are throttled by rate limiter, semaphore bounds in-flight requests
+            async with sem:
+                body = await self.request_until(ALWAYS_TRUE, endpoint, api_id, data=dic)
+            # Order date is paired with records, not set to each record
+            return iso, body.get(key, [])
+
+        # Format business days at once, not per day
+        bdays = bdate_range(start, end)
+        ymds: list[str] = bdays.strftime("%Y%m%d").tolist()
+        isos: list[str] = bdays.strftime("%Y-%m-%d").tolist()
+
+        # Request all days concurrently, then yield in order of days
+        tasks = [asyncio.create_task(fetch(ymd, iso)) for ymd, iso in zip(ymds, isos, strict=True)]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def add_callback_on_real_data(
+        self, real_type: str, callback: Callable, batch_ms: int = 0
+    ) -> None:
         """
         실시간 데이터 수신 시 호출될 콜백 함수를 추가합니다. (trnm이 'REAL'인 경우)
 
-        * callback 함수는 서버 응답 string 그대로를 인자로 받습니다.
+        * callback 함수는 RealData를 인자로 받습니다. (values는 utf-8 bytes 그대로)
+        * values는 utf-8 검증을 거치지 않으므로, 잘못된 utf-8 bytes가 전달될 수 있습니다.
         * real_type을 'PING' 또는 'LOGIN'으로 설정하면 기본 콜백 함수를 덮어씁니다.
 
         콜백 함수는 비동기 콜백 함수를 추가하는 것을 권장합니다.
-        비동기 및 동기 콜백 함수 모두 루프를 블로킹하지 않도록
-        백그라운드에서 실행됩니다. 따라서 데이터 처리 완료 순서가 반드시
-        데이터 수신 순서에 따라 실행되지 않을 수 있습니다.
+        동기 콜백 함수는 데이터 수신 루프에서 바로 실행되므로 가벼운 처리에만 사용합니다.
+        콜백 함수에서 발생한 예외는 출력만 하고 데이터 수신은 계속됩니다.
+        비동기 콜백 함수는 백그라운드 워커에서 실행됩니다. 따라서 데이터 처리 완료
+        순서가 반드시 데이터 수신 순서에 따라 실행되지 않을 수 있습니다.
 
         ex) tick 체결 데이터 (type 'OB')가 수신될 때마다 데이터 출력하기
 
@@ -324,34 +361,60 @@ class API(Client):
 
             > add_callback_on_real_data(real_type='OB', callback=fn)
 
+        batch_ms를 설정하면 해당 시간(ms) 동안 수신된 데이터를 모아 리스트로 한 번에 전달합니다.
+
+            > fn = lambda msgs: print(len(msgs))
+
+            > add_callback_on_real_data(real_type='OB', callback=fn, batch_ms=1)
+
         Args:
             real_type (str): 키움 REST API에 정의된 실시간 데이터 타입
-            callback (Callable): raw 스트링을 인자로 받는 콜백 함수
+            callback (Callable): RealData를 인자로 받는 콜백 함수
+            batch_ms (int, optional): 0보다 크면 list[RealData]를 인자로 받는 콜백 함수
         """
 
-        real_type = real_type.upper()
-        # Asnyc Callback
-        if iscoroutinefunction(callback):
-            self._callbacks[real_type] = wrap_async_callback(self._sem, callback)
-        # Sync Callback
+        # Keep case of real type codes (ex. '0g', '0m', ...)
+        if real_type not in get_args(RealTypeCode):
+            real_type = real_type.upper()
+        # Batched Callback (called with list)
+        if batch_ms > 0:
+            self._callbacks[real_type] = wrap_batch_callback(
+                self._callback_queue, callback, batch_ms
+            )
+        # Asnyc Callback (dispatched to workers)
+        elif iscoroutinefunction(callback):
+            self._callbacks[real_type] = wrap_async_callback(self._callback_queue, callback)
+        # Sync Callback (called inline)
         else:
-            self._callbacks[real_type] = wrap_sync_callback(self._sem, callback)
+            self._callbacks[real_type] = wrap_sync_callback(callback)
+
+    async def _cancel_workers(self) -> None:
+        """
+        Cancel callback worker tasks.
+        """
+        await asyncio.gather(*(cancel(task) for task in self._workers))
+        self._workers = []
 
     def _add_default_callback_on_real_data(self) -> None:
         """
         Add default callback functions on real data receive.
         """
 
-        # Ping
-        async def callback_on_ping(msg: dict):
-            await self.socket.send(msg)
+        # Ping (answered in its own task, not queued behind user async callbacks)
+        def callback_on_ping(msg: dict):
+            task = asyncio.create_task(self.socket.send(msg), name="pong")
+            self._ping_tasks.add(task)
+            task.add_done_callback(self._ping_tasks.discard)
 
         self.add_callback_on_real_data(real_type="PING", callback=callback_on_ping)
 
         # Login
-        def callback_on_login(msg: dict):
-            if msg.get("return_code") != 0:
-                raise RuntimeError(f"Login failed with return_code not zero, {msg}.")
+        def callback_on_login(msg: LoginType):
+            if msg.return_code != 0:
+                # Close explicitly in another task, since close() cancels the receiving task
+                print(f"Login failed with return_code not zero, closing connection: {msg}.")
+                self._close_task = asyncio.create_task(self.close(), name="close")
+                return
             print(msg)
 
         self.add_callback_on_real_data(real_type="LOGIN", callback=callback_on_login)
@@ -362,68 +425,95 @@ class API(Client):
         Decoder patially checks 'trnm' and 'type' in order to speed up.
 
         If trnm is "REAL", the argument to callback function is RealData instance.
+        If trnm is "LOGIN", the argument to callback function is LoginType instance.
         Otherwise, the argument to callback function is json dict.
 
         Raises:
-            Exception: Exception raised by the callback function or decoder
+            Exception: Exception raised by the decoder
         """
-        decoder = msgspec.json.Decoder(type=RealType)
+        decode_real = msgspec.json.Decoder(type=RealType).decode
+        decode_real_any = msgspec.json.Decoder(type=RealTypeAny).decode
+        # Typed decoders for other trnm, otherwise decoded to json dict
+        decoders: dict[str, Callable] = {
+            "LOGIN": msgspec.json.Decoder(type=LoginType).decode,
+        }
+        # Bound locally to skip attribute lookups per frame,
+        # updates by add_callback_on_real_data() are still visible.
+        callback = self._callbacks.get
+        default = self._default_callback
         while not self._stop_event.is_set():
             try:
-                raw: str = await self.queue.get()
+                raw: bytes = await self.queue.get()
             except asyncio.CancelledError:
                 break
 
             try:
-                msg = decoder.decode(raw)  # partially decoded for speed up
+                try:
+                    msg = decode_real(raw)  # partially decoded for speed up
+                except msgspec.ValidationError:
+                    msg = decode_real_any(raw)  # real type not in RealTypeCode
                 if msg.trnm == "REAL":
                     for data in msg.data:
-                        asyncio.create_task(
-                            self._callbacks[data.type](
-                                RealData(bytes(data.values), data.type, data.name, data.item)
-                            )
+                        callback(data.type, default)(
+                            RealData(bytes(data.values), data.type, data.name, data.item)
                         )
                     continue
 
-                dic = orjson.loads(raw)
-                asyncio.create_task(self._callbacks[msg.trnm](dic))
+                decode = decoders.get(msg.trnm, orjson.loads)
+                callback(msg.trnm, default)(decode(raw))
 
             except Exception as err:
                 raise Exception("Failed to handling websocket data.") from err
 
-            finally:
-                self.queue.task_done()
-
-    async def register_tick(
+    async def register(
         self,
         grp_no: str,
-        codes: list[str],
+        data: list[tuple[list[str], str | list[str]]],
         refresh: str = "1",
     ) -> None:
         """
-        주어진 그룹번호와 종목 코드에 대해 주식체결 데이터를 등록합니다. (타입 '0B')
+        주어진 그룹번호에 여러 (종목코드, 실시간 데이터 타입) 쌍을 한 번의 요청으로 등록합니다.
+
+        ex) 같은 그룹에 체결 데이터와 호가 데이터를 함께 등록하기
+
+            > register(grp_no='1', data=[(codes, ['0B', '0D'])])
 
         Args:
             grp_no (str): 그룹번호
-            codes (list[str]): 종목코드 리스트
+            data (list[tuple[list[str], str | list[str]]]): (종목코드 리스트, 타입) 리스트
             refresh (str, optional): 기존등록유지여부 (기존유지:'1', 신규등록:'0').
         """
 
+        codes = {code for items, _ in data for code in items}
         assert len(codes) <= 100, f"Max 100 codes per group, got {len(codes)} codes."
         await self.socket.send(
-            {
-                "trnm": "REG",
-                "grp_no": grp_no,
-                "refresh": refresh,
-                "data": [
-                    {
-                        "item": codes,
-                        "type": ["0B"],
-                    }
+            RegisterType(
+                trnm="REG",
+                grp_no=grp_no,
+                refresh=refresh,
+                data=[
+                    RegisterType.Data(item=items, type=[type] if isinstance(type, str) else type)
+                    for items, type in data
                 ],
-            }
+            )
         )
 
+    async def register_tick(
+        self,
+        grp_no: str,
+        codes: list[str],
+        refresh: str = "1",
+    ) -> None:
+        """
+        주어진 그룹번호와 종목 코드에 대해 주식체결 데이터를 등록합니다. (타입 '0B')
+
+        Args:
+            grp_no (str): 그룹번호
+            codes (list[str]): 종목코드 리스트
+            refresh (str, optional): 기존등록유지여부 (기존유지:'1', 신규등록:'0').
+        """
+        await self.register(grp_no, [(codes, "0B")], refresh)
+
     async def register_hoga(
         self,
         grp_no: str,
@@ -438,21 +528,7 @@ class API(Client):
             codes (list[str]): 종목코드 리스트
             refresh (str, optional): 기존등록유지여부 (기존유지:'1', 신규등록:'0').
         """
-
-        assert len(codes) <= 100, f"Max 100 codes per group, got {len(codes)} codes."
-        await self.socket.send(
-            {
-                "trnm": "REG",
-                "grp_no": grp_no,
-                "refresh": refresh,
-                "data": [
-                    {
-                        "item": codes,
-                        "type": ["0D"],
-                    }
-                ],
-            }
-        )
+        await self.register(grp_no, [(codes, "0D")], refresh)
 
     async def remove_register(self, grp_no: str, codes: list[str], type: str | list[str]) -> None:
         """
@@ -467,10 +543,10 @@ class API(Client):
         if isinstance(type, str):
             type = [type]
         await self.socket.send(
-            {
-                "trnm": "REMOVE",
-                "grp_no": grp_no,
-                "refresh": "",
-                "data": [{"item": codes, "type": type}],
-            }
+            RegisterType(
+                trnm="REMOVE",
+                grp_no=grp_no,
+                refresh="",
+                data=[RegisterType.Data(item=codes, type=type)],
+            )
         )
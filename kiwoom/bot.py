@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
-from typing import Self, Optional
+from datetime import date
+from typing import AsyncIterator, Optional, Self
 
 from pandas import DataFrame
 
@@ -16,17 +17,20 @@ class Bot:
     사용자가 API 세부 동작을 알지 못해도 전략 수행에 집중할 수 있도록 합니다.
     """
 
-    def __init__(self, host: str, appkey: str, secretkey: str, api: API | None = None):
+    def __init__(
+        self, host: str, appkey: str | bytes, secretkey: str | bytes, api: API | None = None
+    ):
         """
         Bot 클래스 인스턴스를 초기화합니다.
 
         Args:
             host (str): 실서버 / 모의서버 도메인
-            appkey (str): 파일경로 / 앱키
-            secretkey (str): 파일경로 / 시크릿키
+            appkey (str | bytes): 파일경로 / 앱키
+            secretkey (str | bytes): 파일경로 / 시크릿키
             api (API, optional): API를 별도로 구현했다면 인스턴스 전달가능
         """
         self.api = api if api else API(host, appkey, secretkey)
+        self._stock_lists: dict[tuple[str, bool, str], list[str]] = dict()
 
     async def __aenter__(self) -> Self:
         """
@@ -87,6 +91,7 @@ class Bot:
     async def stock_list(self, market: str, ats: bool = True) -> list[str]:
         """
         주어진 market 코드에 해당하는 주식 종목코드 목록을 반환합니다.
+        종목코드 목록은 하루 단위로 캐시되어 같은 날 재요청하지 않습니다.
 
         Args:
             market (str): {
@@ -100,16 +105,26 @@ class Bot:
             list[str]: 종목코드 리스트
         """
 
+        # Cached for today
+        today = date.today().isoformat()
+        key = (market, ats, today)
+        if key in self._stock_lists:
+            return list(self._stock_lists[key])
+        # Drop lists cached on previous days
+        for k in [k for k in self._stock_lists if k[2] != today]:
+            del self._stock_lists[k]
+
         # Add NXT market
         if market == "NXT":
             kospi = await self.stock_list("0")
             kosdaq = await self.stock_list("10")
-            codes = [c for c in kospi + kosdaq if "AL" in c]
-            return sorted(codes)
+            codes = sorted([c for c in kospi + kosdaq if "AL" in c])
+        else:
+            data = await self.api.stock_list(market)
+            codes = proc.stock_list(data, ats)
 
-        data = await self.api.stock_list(market)
-        codes = proc.stock_list(data, ats)
-        return codes
+        self._stock_lists[key] = codes
+        return list(codes)
 
     async def sector_list(self, market: str) -> list[str]:
         """
@@ -173,6 +188,28 @@ class Bot:
         df = proc.trade.process(data)
         return df
 
+    async def trade_iter(self, start: str, end: str = "") -> AsyncIterator[DataFrame]:
+        """
+        trade()와 동일한 체결내역을 일자 순서대로 조회되는 즉시 데이터프레임으로 반환합니다.
+        체결내역이 없는 일자는 건너뜁니다.
+
+        ex) 조회와 동시에 csv 파일로 저장하기
+
+            > await proc.trade.to_csv("trade.csv", ".", bot.trade_iter(start, end))
+
+        Args:
+            start (str): 시작일자 in YYYYMMDD format
+            end (str, optional): 종료일자 in YYYYMMDD format
+
+        Yields:
+            DataFrame: 키움증권 '0343' 화면 'Excel 내보내기' 형식
+        """
+        # Close api.trade_iter() to cancel pending requests when closed early
+        async with contextlib.aclosing(self.api.trade_iter(start, end)) as days:
+            async for ord_dt, records in days:
+                if records:
+                    yield proc.trade.process([(ord_dt, records)])
+
     async def run(self):
         """
         전략 로직을 구현하고 실행합니다.
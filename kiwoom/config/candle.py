@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import pandas as pd
 
 PERIOD_TO_DTYPES: dict[str, dict[str, type]] = {
@@ -11,16 +13,17 @@ PERIOD_TO_API_ID: dict[str, dict[str, str]] = {
     "sector": {"tick": "ka20004", "min": "ka20005", "day": "ka20006"},
 }
 
-PERIOD_TO_DATA: dict[str, dict[str, str]] = {
+# Read-only base request data, copy with overrides on request
+PERIOD_TO_DATA: dict[str, dict[str, MappingProxyType]] = {
     "stock": {
-        "tick": {"stk_cd": "", "tic_scope": "1", "upd_stkpc_tp": "1"},
-        "min": {"stk_cd": "", "tic_scope": "1", "upd_stkpc_tp": "1"},
-        "day": {"stk_cd": "", "base_dt": "", "upd_stkpc_tp": "1"},
+        "tick": MappingProxyType({"stk_cd": "", "tic_scope": "1", "upd_stkpc_tp": "1"}),
+        "min": MappingProxyType({"stk_cd": "", "tic_scope": "1", "upd_stkpc_tp": "1"}),
+        "day": MappingProxyType({"stk_cd": "", "base_dt": "", "upd_stkpc_tp": "1"}),
     },
     "sector": {
-        "tick": {"inds_cd": "", "tic_scope": "1"},
-        "min": {"inds_cd": "", "tic_scope": "1"},
-        "day": {"inds_cd": "", "base_dt": ""},
+        "tick": MappingProxyType({"inds_cd": "", "tic_scope": "1"}),
+        "min": MappingProxyType({"inds_cd": "", "tic_scope": "1"}),
+        "day": MappingProxyType({"inds_cd": "", "base_dt": ""}),
     },
 }
 
@@ -149,7 +152,7 @@ def handle_time(df, code: str, period: str) -> pd.DataFrame:
 
 
 def valid(body: dict, period: str, ctype: str) -> bool:
-    key: str = PERIOD_TO_BODY_KEY[ctype][period]
-    empty: bool = not body[key]
-    dummy: bool = (len(body[key]) == 1) and (not body[key][0]["cur_prc"])
-    return not (empty or dummy)
+    chart: list[dict] = body[PERIOD_TO_BODY_KEY[ctype][period]]
+    if not chart:
+        return False  # empty
+    return len(chart) > 1 or bool(chart[0]["cur_prc"])  # not dummy
@@ -9,7 +9,8 @@ __all__ = [
     "HTTP_READ_TIMEOUT",
     "HTTP_TCP_CONNECTORS",
     "WEBSOCKET_HEARTBEAT",
-    "WEBSOCKET_MAX_CONCURRENCY",
+    "WEBSOCKET_CALLBACK_WORKERS",
+    "WEBSOCKET_BATCH_MAX_SIZE",
     "State",
 ]
 
@@ -30,8 +31,9 @@ HTTP_READ_TIMEOUT: float = 5.0
 HTTP_TCP_CONNECTORS: int = 100
 
 WEBSOCKET_HEARTBEAT: int = 30
-WEBSOCKET_MAX_CONCURRENCY: int = 1000
+WEBSOCKET_CALLBACK_WORKERS: int = 16  # number of async callback workers
 WEBSOCKET_QUEUE_MAX_SIZE: int = 0  # no limit
+WEBSOCKET_BATCH_MAX_SIZE: int = 1000  # max messages per batched callback
 
 
 # Connection State
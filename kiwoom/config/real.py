@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Literal, Optional
 
 from msgspec import Raw, Struct, field
 
@@ -37,11 +37,35 @@ class RealData:
         )
 
 
+# Real data types of Kiwoom REST API
+RealTypeCode = Literal[
+    "00",  # 주문체결
+    "04",  # 잔고
+    "0A",  # 주식기세
+    "0B",  # 주식체결
+    "0C",  # 주식우선호가
+    "0D",  # 주식호가잔량
+    "0E",  # 주식시간외호가
+    "0F",  # 주식당일거래원
+    "0G",  # ETF NAV
+    "0H",  # 주식예상체결
+    "0I",  # 국제금환산가격
+    "0J",  # 업종지수
+    "0U",  # 업종등락
+    "0g",  # 주식종목정보
+    "0m",  # ELW 이론가
+    "0s",  # 장시작시간
+    "0u",  # ELW 지표
+    "0w",  # 종목프로그램매매
+    "1h",  # VI발동/해제
+]
+
+
 # To decode raw json with msgspec
 class RealType(Struct):
     class Data(Struct):
         values: Raw
-        type: str
+        type: RealTypeCode  # decoded to interned str
         name: str
         item: str
 
@@ -49,6 +73,44 @@ class RealType(Struct):
     data: Optional[list[RealType.Data]] = None
 
 
+# To decode raw json with msgspec, if type is not in RealTypeCode
+class RealTypeAny(Struct):
+    class Data(Struct):
+        values: Raw
+        type: str
+        name: str
+        item: str
+
+    trnm: str
+    data: Optional[list[RealTypeAny.Data]] = None
+
+
+# To decode raw json with msgspec
+class LoginType(Struct):
+    """
+    To decode response of trnm 'LOGIN'
+    """
+
+    return_code: int
+    return_msg: str = ""
+
+
+# To encode json with msgspec
+class RegisterType(Struct):
+    """
+    To encode request of trnm 'REG' and 'REMOVE'
+    """
+
+    class Data(Struct):
+        item: list[str]
+        type: list[str]
+
+    trnm: str
+    grp_no: str
+    refresh: str
+    data: list[RegisterType.Data]
+
+
 # To decode raw json with msgspec
 class TickValuesType(Struct):
     """
@@ -1,5 +1,21 @@
+from types import MappingProxyType
+
 REQUEST_LIMIT_DAYS = 60 + 5  # 2 months + extra days
 
+# Read-only base request data, copy with overrides on request
+REQUEST_DATA: MappingProxyType = MappingProxyType(
+    {
+        "ord_dt": "",  # YYYYMMDD (Optional)
+        "qry_tp": "1",  # 전체/체결
+        "stk_bond_tp": "1",  # 전체/주식/채권
+        "mrkt_tp": "0",  # 전체/코스피/코스닥/OTCBB/ECN
+        "sell_tp": "0",  # 전체/매도/매수
+        "dmst_stex_tp": "%",  # 전체/KRX/NXT/SOR
+        # 'stk_cd': '',  # 종목코드 (Optional)
+        # 'fr_ord_no': '',  # 시작주문번호 (Optional)
+    }
+)
+
 COLUMN_TRADE: list[str] = [
     # 1st row
     "주식채권",
@@ -16,27 +16,46 @@ from kiwoom.config.http import (
 )
 from kiwoom.http.debug import debugger, dumps
 from kiwoom.http.response import Response
-from kiwoom.http.utils import RateLimiter
+from kiwoom.http.utils import ALWAYS_TRUE, RateLimiter
 
 __all__ = ["Client"]
 
 
+def _read_key(key: str | bytes) -> str:
+    """
+    Read key from file once if key is a file path, otherwise return raw key.
+
+    Args:
+        key (str | bytes): file path or raw key
+
+    Returns:
+        str: raw key
+    """
+    if isinstance(key, bytes):
+        key = key.decode()
+    if isfile(key):
+        with open(key, "r") as f:
+            return f.read().strip()
+    return key
+
+
 class Client:
-    def __init__(self, host: str, appkey: str, secretkey: str):
+    def __init__(self, host: str, appkey: str | bytes, secretkey: str | bytes):
         """
         Initialize Client instance.
+        Key files are read only once here, not on every (re)connect.
 
         Args:
             host (str): domain
-            appkey (str): file path or raw appkey
-            secretkey (str): file path or raw secretkey
+            appkey (str | bytes): file path or raw appkey
+            secretkey (str | bytes): file path or raw secretkey
         """
         self.host: str = host
         self.debugging: bool = False
 
         self._auth: str = ""
-        self._appkey: str = appkey
-        self._secretkey: str = secretkey
+        self._appkey: str = _read_key(appkey)
+        self._secretkey: str = _read_key(secretkey)
         self._headers: Optional[dict] = None
 
         self._state_http = State.CLOSED
@@ -44,21 +63,22 @@ class Client:
         self._limiter: RateLimiter = RateLimiter()
         self._session: ClientSession = None
 
-    async def connect(self, appkey: str, secretkey: str, headers: Optional[dict] = None) -> None:
+    async def connect(
+        self, appkey: str | bytes, secretkey: str | bytes, headers: Optional[dict] = None
+    ) -> None:
         """
         Connect to Kiwoom REST API server and receive token.
 
         Args:
-            appkey (str): file path or raw appkey
-            secretkey (str): file path or raw secretkey
+            appkey (str | bytes): file path or raw appkey
+            secretkey (str | bytes): file path or raw secretkey
             headers (dict): 서버 연결 시 사용할 헤더 (User-Agent 등)
         """
-        if isfile(appkey):
-            with open(appkey, "r") as f:
-                self._appkey = f.read().strip()
-        if isfile(secretkey):
-            with open(secretkey, "r") as f:
-                self._secretkey = f.read().strip()
+        # Keys already read (ex. token refresh) are reused without file access
+        if appkey != self._appkey:
+            self._appkey = _read_key(appkey)
+        if secretkey != self._secretkey:
+            self._secretkey = _read_key(secretkey)
         if headers:
             self._headers = headers
 
@@ -262,7 +282,8 @@ class Client:
         Args:
             should_continue (Callable):
                 callable that takes body(dict) and
-                returns boolean value to request again or not
+                returns boolean value to request again or not,
+                if ALWAYS_TRUE is given, it is not called at all
             endpoint (str):
                 endpoint of the server
             api_id (str):
@@ -281,7 +302,8 @@ class Client:
         body = res.json()
 
         # If condition to chain is not met
-        if callable(should_continue) and not should_continue(body):
+        always = should_continue is ALWAYS_TRUE
+        if not always and callable(should_continue) and not should_continue(body):
             return body
 
         # Extract list data only
@@ -293,7 +315,7 @@ class Client:
             bodies[key] = body[key]
 
         # Rercursive call
-        while res.headers.get("cont-yn") == "Y" and should_continue(body):
+        while res.headers.get("cont-yn") == "Y" and (always or should_continue(body)):
             next_key = res.headers.get("next-key")
             headers = self.headers(api_id, cont_yn="Y", next_key=next_key, headers=headers)
 
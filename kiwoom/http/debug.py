@@ -2,6 +2,7 @@ import functools
 import json
 from typing import Callable
 
+import orjson
 from aiohttp import ClientResponse
 from aiohttp.web import HTTPException
 
@@ -66,10 +67,9 @@ def debugger(fn) -> Callable:
     async def wrapper(api, endpoint: str, api_id: str, headers: dict, data: dict) -> Response:
         res: ClientResponse = await fn(api, endpoint, api_id, headers, data)
         async with res:
-            # Async to sync Response
-            resp = Response(
-                url=res.url, status=res.status, headers=res.headers, body=await res.json()
-            )
+            # Async to sync Response, parse with orjson keeping aiohttp content type check
+            body = await res.json(loads=orjson.loads)
+            resp = Response(url=res.url, status=res.status, headers=res.headers, body=body)
 
             # Debugging
             if api.debugging:
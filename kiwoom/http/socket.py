@@ -1,11 +1,11 @@
 import asyncio
 import contextlib
 
-import orjson
+import msgspec
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMessageTypeError, WSMsgType
 
 from kiwoom.config.http import WEBSOCKET_HEARTBEAT, State
-from kiwoom.http.utils import cancel
+from kiwoom.http.utils import FastQueue, cancel
 
 
 class Socket:
@@ -13,16 +13,17 @@ class Socket:
     MOCK = "wss://mockapi.kiwoom.com:10000"  # KRX Only
     ENDPOINT = "/api/dostk/websocket"
 
-    def __init__(self, url: str, queue: asyncio.Queue):
+    def __init__(self, url: str, queue: FastQueue):
         """
         Initialize Socket class.
 
         Args:
             url (str): url of Kiwoom websocket server
-            queue (asyncio.Queue): queue to put received data
+            queue (FastQueue): queue to put received data
         """
         self.url = url
         self._queue = queue
+        self._encoder = msgspec.json.Encoder()
         self._session: ClientSession | None = None
         self._websocket: ClientWebSocketResponse | None = None
 
@@ -56,8 +57,13 @@ class Socket:
                 self._queue_task = None
 
                 self._session = session
+                # Text frames are not decoded nor validated as utf-8.
+                # msgspec validates decoded fields, but RealData.values is passed as raw bytes.
                 self._websocket = await session.ws_connect(
-                    self.url, autoping=True, heartbeat=WEBSOCKET_HEARTBEAT
+                    self.url,
+                    autoping=True,
+                    heartbeat=WEBSOCKET_HEARTBEAT,
+                    decode_text=False,
                 )
 
                 self._stop_event.clear()
@@ -88,28 +94,32 @@ class Socket:
             self._websocket = None
             self._queue_task = None
 
-    async def send(self, msg: str | dict) -> None:
+    async def send(self, msg: str | bytes | dict | msgspec.Struct) -> None:
         """
         Send data to Kiwoom websocket server.
+        dict and msgspec.Struct are encoded to json bytes and sent as text frame.
 
         Args:
-            msg (str | dict): msg should be in json format
+            msg (str | bytes | dict | msgspec.Struct): msg should be in json format
         """
-        if isinstance(msg, dict):
-            # msg = json.dumps(msg)  # slow
-            msg = orjson.dumps(msg).decode("utf-8")
-        await self._websocket.send_str(msg)
-
-    async def recv(self) -> str:
+        if isinstance(msg, str):
+            await self._websocket.send_str(msg)
+            return
+        if not isinstance(msg, bytes):
+            msg = self._encoder.encode(msg)
+        await self._websocket.send_frame(msg, WSMsgType.TEXT)
+
+    async def recv(self) -> bytes:
         """
         Receive data from Kiwoom websocket server and return data.
-        If message type is not str, close the websocket and raise RuntimeError.
+        Text frame is not decoded to str, so returns raw utf-8 encoded bytes.
+        If message type is not text, close the websocket and raise RuntimeError.
 
         Raises:
             RuntimeError: Websocket Connection Error
 
         Returns:
-            str: received json formatted data from websocket
+            bytes: received json formatted data from websocket
         """
         try:
             return await self._websocket.receive_str()
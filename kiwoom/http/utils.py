@@ -1,11 +1,29 @@
 import asyncio
 import contextlib
-from typing import Callable
+import sys
+from collections import deque
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Coroutine
 
-from kiwoom.config.http import REQ_LIMIT_PER_SECOND
+from kiwoom.config.http import REQ_LIMIT_PER_SECOND, WEBSOCKET_BATCH_MAX_SIZE
 from kiwoom.config.real import RealData
 
-__all__ = ["cancel", "RateLimiter", "wrap_async_callback", "wrap_sync_callback"]
+__all__ = [
+    "ALWAYS_TRUE",
+    "cancel",
+    "callback_worker",
+    "FastQueue",
+    "install_uvloop",
+    "RateLimiter",
+    "run_uvloop",
+    "uvloop_factory",
+    "wrap_async_callback",
+    "wrap_batch_callback",
+    "wrap_sync_callback",
+]
+
+# Sentinel for should_continue, Client.request_until skips calling it
+ALWAYS_TRUE: Callable = lambda body: True
 
 
 class RateLimiter:
@@ -41,44 +59,178 @@ class RateLimiter:
             await asyncio.sleep(wait)
 
 
-def wrap_async_callback(semaphore: asyncio.Semaphore, callback: Callable) -> Callable:
+class FastQueue:
+    def __init__(self, maxsize: int = 0):
+        """
+        Deque based queue for single consumer, which replaces asyncio.Queue.
+        Getting item from non-empty queue returns without creating Future.
+
+        Args:
+            maxsize (int): max size of the queue, no limit if not positive
+        """
+        self._maxsize = maxsize
+        self._deque: deque = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def qsize(self) -> int:
+        return len(self._deque)
+
+    def empty(self) -> bool:
+        return not self._deque
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._deque)
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Put item without blocking, even if the queue is full.
+
+        Args:
+            item (Any): item to put
+        """
+        self._deque.append(item)
+        self._not_empty.set()
+        if self.full():
+            self._not_full.clear()
+
+    async def put(self, item: Any) -> None:
+        """
+        Put item, wait until the queue is not full.
+
+        Args:
+            item (Any): item to put
+        """
+        while self.full():
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    async def get(self) -> Any:
+        """
+        Get item, wait until the queue is not empty.
+
+        Returns:
+            Any: item in FIFO order
+        """
+        while not self._deque:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        item = self._deque.popleft()
+        if not self.full():
+            self._not_full.set()
+        return item
+
+
+def wrap_async_callback(queue: asyncio.Queue, callback: Callable) -> Callable:
     """
-    Wrap async callback to run in async context.
+    Wrap async callback to be dispatched to the callback workers.
+    Calling wrapped callback only puts (callback, msg) to the queue without creating task.
 
     Args:
-        semaphore (asyncio.Semaphore): semaphore to limit the number of callbacks
+        queue (asyncio.Queue): queue consumed by callback_worker tasks
         callback (Callable): callback to be wrapped
 
     Returns:
         Callable: wrapped callback
     """
 
-    async def wrapper(msg: RealData | dict):
-        async with semaphore:
-            await callback(msg)
+    def wrapper(msg: RealData | dict):
+        queue.put_nowait((callback, msg))
 
     return wrapper
 
 
-def wrap_sync_callback(semaphore: asyncio.Semaphore, callback: Callable) -> Callable:
+def wrap_sync_callback(callback: Callable) -> Callable:
     """
-    Wrap sync callback to run in async context.
+    Wrap sync callback to be called inline in the receiving loop.
+    Exception raised by the callback is printed and does not stop the receiving loop.
 
     Args:
-        semaphore (asyncio.Semaphore): semaphore to limit the number of callbacks
         callback (Callable): callback to be wrapped
 
     Returns:
         Callable: wrapped callback
     """
 
-    async def wrapper(msg: RealData | dict):
-        async with semaphore:
-            await asyncio.get_running_loop().run_in_executor(None, callback, msg)
+    def wrapper(msg: RealData | dict):
+        try:
+            callback(msg)
+        except Exception as err:
+            print(f"Failed to run callback {callback}: {err}")
 
     return wrapper
 
 
+def wrap_batch_callback(
+    queue: asyncio.Queue,
+    callback: Callable,
+    batch_ms: int,
+    max_size: int = WEBSOCKET_BATCH_MAX_SIZE,
+) -> Callable:
+    """
+    Wrap callback to be called once with list of messages received within batch_ms.
+    Batch is flushed early if it reaches max_size.
+    Async callback is dispatched to the callback workers, sync callback is called inline.
+    Exception raised by sync callback is printed and does not stop the receiving loop.
+
+    Args:
+        queue (asyncio.Queue): queue consumed by callback_worker tasks
+        callback (Callable): callback which takes list of messages
+        batch_ms (int): time window to batch messages in milliseconds
+        max_size (int, optional): max number of messages in a batch
+
+    Returns:
+        Callable: wrapped callback
+    """
+    is_async = iscoroutinefunction(callback)
+    batch: list[RealData | dict] = []
+    timer: asyncio.TimerHandle | None = None
+
+    def flush():
+        nonlocal batch, timer
+        if timer is not None:
+            timer.cancel()
+            timer = None
+        msgs, batch = batch, []
+        if is_async:
+            queue.put_nowait((callback, msgs))
+            return
+        try:
+            callback(msgs)
+        except Exception as err:
+            print(f"Failed to run callback {callback}: {err}")
+
+    def wrapper(msg: RealData | dict):
+        nonlocal timer
+        batch.append(msg)
+        if len(batch) >= max_size:
+            flush()
+        elif timer is None:
+            timer = asyncio.get_running_loop().call_later(batch_ms / 1000, flush)
+
+    return wrapper
+
+
+async def callback_worker(queue: asyncio.Queue) -> None:
+    """
+    Long-lived worker which awaits async callbacks put by wrap_async_callback.
+    Exception raised by the callback is printed and does not stop the worker.
+    Run this task in background with asyncio.create_task().
+
+    Args:
+        queue (asyncio.Queue): queue to get (callback, msg) from
+    """
+    while True:
+        callback, msg = await queue.get()
+        try:
+            await callback(msg)
+        except Exception as err:
+            print(f"Failed to run callback {callback}: {err}")
+        finally:
+            queue.task_done()
+
+
 async def cancel(task: asyncio.Task | None) -> None:
     """
     Cancel a task if it exists.
@@ -90,3 +242,61 @@ async def cancel(task: asyncio.Task | None) -> None:
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await task
+
+
+def uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Get new_event_loop of uvloop (or winloop on Windows) if installed.
+
+    Returns:
+        Callable | None: event loop factory, None if neither is installed
+    """
+    try:
+        import uvloop as loop
+    except ImportError:
+        try:
+            import winloop as loop
+        except ImportError:
+            return None
+    return loop.new_event_loop
+
+
+def install_uvloop() -> bool:
+    """
+    Set uvloop (or winloop on Windows) event loop policy if installed.
+    Already running event loop is not replaced, so it applies to loops created afterwards.
+    Event loop policy is deprecated since python 3.14, use run_uvloop() instead.
+
+    Returns:
+        bool: whether uvloop or winloop event loop policy is set
+    """
+    try:
+        import uvloop as loop
+    except ImportError:
+        try:
+            import winloop as loop
+        except ImportError:
+            return False
+
+    if not isinstance(asyncio.get_event_loop_policy(), loop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(loop.EventLoopPolicy())
+    return True
+
+
+def run_uvloop(main: Coroutine) -> Any:
+    """
+    Run coroutine like asyncio.run() on uvloop (or winloop on Windows) if installed.
+    Event loop is created by loop factory, event loop policy is only set on python < 3.11.
+
+    Args:
+        main (Coroutine): coroutine to run (ex. main())
+
+    Returns:
+        Any: return value of the coroutine
+    """
+    if sys.version_info < (3, 11):
+        install_uvloop()
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop_factory()) as runner:
+        return runner.run(main)
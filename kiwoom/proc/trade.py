@@ -1,7 +1,9 @@
-from os import getcwd, makedirs
+from contextlib import aclosing
+from os import getcwd, linesep, makedirs, remove, replace
 from os.path import exists, isdir, join
-from pathlib import Path
+from typing import AsyncIterable, AsyncIterator
 
+import numpy as np
 from pandas import DataFrame
 
 from kiwoom.config import ENCODING
@@ -12,11 +14,14 @@ from kiwoom.config.trade import (
 
 
 # 체결내역 관련 처리함수
-def process(data: list[dict]) -> DataFrame:
-    if not data:
+def process(data: list[tuple[str, list[dict]]]) -> DataFrame:
+    records = [rec for _, recs in data for rec in recs]
+    if not records:
         return DataFrame(columns=COLUMN_TRADE)
 
-    df = DataFrame(data)
+    df = DataFrame(records)
+    # Broadcast order date of each day to its records
+    df["ord_dt"] = np.repeat([dt for dt, _ in data], [len(recs) for _, recs in data])
     df.rename(columns=COLUMN_MAPPER_TRADE, inplace=True)
 
     ints = [
@@ -42,9 +47,69 @@ def process(data: list[dict]) -> DataFrame:
     return df
 
 
-async def to_csv(file: str, path: str, df: DataFrame, encoding: str = ENCODING):
+# 키움증권 0343 화면
+_COLUMN_ROW1: list[str] = [  # 1st row
+    "주식채권",
+    "주문번호",
+    "원주문번호",
+    "종목번호",
+    "매매구분",
+    "주문유형구분",
+    "주문수량",
+    "주문단가",
+    "확인수량",
+    "체결번호",
+    "스톱가",
+]
+_COLUMN_ROW2: list[str] = [  # 2nd row
+    "주문일자",
+    "종목명",
+    "접수구분",
+    "신용거래구분",
+    "체결수량",
+    "체결평균단가",
+    "정정/취소",
+    "통신",
+    "예약/반대",
+    "체결시간",
+    "거래소",
+]
+
+
+def _encode(df: DataFrame, encoding: str) -> bytes:
+    # Each record is written in two rows, interleaved and written by pandas C writer.
+    # Fields containing ',' or '"' (ex. 종목명) are quoted, and lines end with os.linesep
+    # as in text mode, since the file is opened in binary mode.
+    rows = np.empty((2 * len(df), len(_COLUMN_ROW1)), dtype=object)
+    rows[0::2] = df[_COLUMN_ROW1].astype(str).to_numpy()
+    rows[1::2] = df[_COLUMN_ROW2].astype(str).to_numpy()
+    text = DataFrame(rows).to_csv(header=False, index=False, lineterminator=linesep)
+    # Encode at once rather than per line
+    return text.encode(encoding)
+
+
+async def _chunks(df: DataFrame | AsyncIterable[DataFrame]) -> AsyncIterator[DataFrame]:
+    if isinstance(df, DataFrame):
+        yield df
+        return
+    # Close source generator (ex. pending requests) even if writing fails
+    if not hasattr(df, "aclose"):
+        async for chunk in df:
+            yield chunk
+        return
+    async with aclosing(df):
+        async for chunk in df:
+            yield chunk
+
+
+async def to_csv(
+    file: str,
+    path: str,
+    df: DataFrame | AsyncIterable[DataFrame],
+    encoding: str = ENCODING,
+):
     # Validate
-    if df.empty:
+    if isinstance(df, DataFrame) and df.empty:
         print("DataFrame is empty, skip writing to csv.")
         return
     if not path:
@@ -58,45 +123,29 @@ async def to_csv(file: str, path: str, df: DataFrame, encoding: str = ENCODING):
     if not file.endswith(".csv"):
         file = f"{file}.csv"
     file = join(path, file)
-    if exists(file):
-        Path.unlink(file)
 
-    # 키움증권 0343 화면
-    col1 = [  # 1st row
-        "주식채권",
-        "주문번호",
-        "원주문번호",
-        "종목번호",
-        "매매구분",
-        "주문유형구분",
-        "주문수량",
-        "주문단가",
-        "확인수량",
-        "체결번호",
-        "스톱가",
-    ]
-    col2 = [  # 2nd row
-        "주문일자",
-        "종목명",
-        "접수구분",
-        "신용거래구분",
-        "체결수량",
-        "체결평균단가",
-        "정정/취소",
-        "통신",
-        "예약/반대",
-        "체결시간",
-        "거래소",
-    ]
-    df = df.astype(str)
-    with open(file, "w", encoding=encoding) as f:
-        lines = []
-        row1 = df[col1]
-        row2 = df[col2]
-        for (_, r1), (_, r2) in zip(row1.iterrows(), row2.iterrows(), strict=True):
-            lines.append(",".join(r1) + "\n")
-            lines.append(",".join(r2) + "\n")
-
-        f.write(",".join(col1) + "\n")  # Header col 1
-        f.write(",".join(col2) + "\n")  # Header col 2
-        f.writelines(lines)
+    # Write each chunk to temp file as soon as it arrives (ex. Bot.trade_iter),
+    # existing file is replaced only after all chunks are written
+    tmp = f"{file}.tmp"
+    f = None
+    try:
+        async with aclosing(_chunks(df)) as chunks:
+            async for chunk in chunks:
+                if chunk.empty:
+                    continue
+                if f is None:
+                    f = open(tmp, "wb")
+                    f.write((",".join(_COLUMN_ROW1) + linesep).encode(encoding))  # Header col 1
+                    f.write((",".join(_COLUMN_ROW2) + linesep).encode(encoding))  # Header col 2
+                f.write(_encode(chunk, encoding))
+    except BaseException:
+        if f is not None:
+            f.close()
+            remove(tmp)
+        raise
+
+    if f is None:
+        print("DataFrame is empty, skip writing to csv.")
+        return
+    f.close()
+    replace(tmp, file)
@@ -1,10 +1,11 @@
-import asyncio
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import pandas as pd
 
 from kiwoom import REAL, Bot
+from kiwoom.http.utils import run_uvloop
 from kiwoom.proc.candle import to_csv
 
 
@@ -117,8 +118,9 @@ async def test_to_csv(bot):
 
 
 async def main():
-    appkey = "../keys/appkey.txt"
-    scretkey = "../keys/secretkey.txt"
+    # 키 파일은 시작 시 한 번만 읽음
+    appkey = Path("../keys/appkey.txt").read_text().strip()
+    scretkey = Path("../keys/secretkey.txt").read_text().strip()
     async with Bot(REAL, appkey, scretkey) as bot:
         await bot.connect()
         bot.debug(False)
@@ -138,4 +140,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    df = asyncio.run(main())
+    df = run_uvloop(main())  # uvloop / winloop if installed
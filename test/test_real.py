@@ -1,7 +1,9 @@
 import asyncio
 import time
+from pathlib import Path
 
 from kiwoom import REAL, Bot
+from kiwoom.http.utils import run_uvloop
 
 
 def timer(fn):
@@ -16,8 +18,9 @@ def timer(fn):
 
 
 async def test_real():
-    appkey = "../keys/appkey.txt"
-    scretkey = "../keys/secretkey.txt"
+    # 키 파일은 시작 시 한 번만 읽음
+    appkey = Path("../keys/appkey.txt").read_text().strip()
+    scretkey = Path("../keys/secretkey.txt").read_text().strip()
 
     async with Bot(REAL, appkey, scretkey) as bot:
         await bot.connect()
@@ -44,4 +47,4 @@ async def test_real():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_real())
+    run_uvloop(test_real())  # uvloop / winloop if installed
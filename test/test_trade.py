@@ -1,42 +1,47 @@
-import asyncio
-from datetime import datetime, timedelta
+import time
+from pathlib import Path
+from typing import AsyncIterator
 
 from pandas import DataFrame
 
 from kiwoom import REAL, Bot
 from kiwoom.config.trade import REQUEST_LIMIT_DAYS
+from kiwoom.http.utils import run_uvloop
 from kiwoom.proc.trade import to_csv
 
 
-async def test_trade(bot) -> DataFrame:
+def _yyyymmdd(ts: float) -> str:
+    tm = time.localtime(ts)
+    return f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+
+
+def test_trade(bot) -> AsyncIterator[DataFrame]:
     # 체결내역 (최근 2달 제한)
-    fmt = "%Y%m%d"
-    today = datetime.today()
-    start = today - timedelta(days=REQUEST_LIMIT_DAYS)
-    start, end = start.strftime(fmt), today.strftime(fmt)
+    now = time.time()
+    start = _yyyymmdd(now - REQUEST_LIMIT_DAYS * 86400)
+    end = _yyyymmdd(now)
 
     print(f"Trade({start=}, {end=})")
-    df = await bot.trade(start, end)
-    print(df)
-    return df
+    return bot.trade_iter(start, end)
 
 
-async def test_to_csv(df: DataFrame):
+async def test_to_csv(dfs: AsyncIterator[DataFrame]):
+    # 일자별 조회와 csv 저장을 동시에 진행
     print("Save('./trade.csv')")
-    await to_csv("trade.csv", ".", df, encoding="euc-kr")
-    return df
+    await to_csv("trade.csv", ".", dfs, encoding="euc-kr")
 
 
 async def main():
-    appkey = "../keys/appkey.txt"
-    scretkey = "../keys/secretkey.txt"
+    # 키 파일은 시작 시 한 번만 읽음
+    appkey = Path("../keys/appkey.txt").read_text().strip()
+    scretkey = Path("../keys/secretkey.txt").read_text().strip()
 
     async with Bot(REAL, appkey, scretkey) as bot:
         bot.debug(True)
         await bot.connect()
-        df = await test_trade(bot)
-        await test_to_csv(df)
+        dfs = test_trade(bot)
+        await test_to_csv(dfs)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_uvloop(main())  # uvloop / winloop if installed